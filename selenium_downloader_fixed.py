@@ -20,9 +20,15 @@ Note: Keep Chrome and chromedriver reasonably up to date. If "headless" causes i
 import rarfile
 import shutil
 import argparse
+import asyncio
 import time
 import os
 import re
+import json
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Optional
 from rich.console import Console
@@ -39,6 +45,37 @@ from webdriver_manager.chrome import ChromeDriverManager
 from typing import Optional
 from urllib.parse import urlparse, parse_qs, unquote, unquote_plus
 
+# requests is optional: only used for the HEAD fallback in get_filename_from_url
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# playwright is optional: only needed for --async
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+# Profile-dir locking: fcntl on POSIX, msvcrt on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# watchdog is optional: without it we fall back to polling the download folder
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:
+    Observer = None
+    PatternMatchingEventHandler = object
+
 
 console = Console()
 
@@ -46,10 +83,67 @@ console = Console()
 DEFAULT_MAX_WAIT = 20
 DEFAULT_DOWNLOAD_WAIT = 30
 DEFAULT_SESSION_REFRESH = 10
+DEFAULT_WORKERS = 3
+MAX_WORKERS = 5
+DEFAULT_PROFILE_DIR = Path.home() / ".selenium_downloader_profile"
+# A partial download untouched for this long belongs to a dead browser
+STALE_PARTIAL_AGE = 300
+
+# Content-Disposition: filename*=UTF-8''%e2%82%ac%20rates  or filename="name.ext"
+_CD_FILENAME_STAR = re.compile(r"filename\*\s*=\s*([^;]+)", re.I)
+_CD_FILENAME = re.compile(r'filename\s*=\s*"?(?P<name>[^\";]+)"?', re.I)
+# Chrome's duplicate suffix: "game (1)"
+_DUP_SUFFIX_RE = re.compile(r"\s*\(\d+\)$")
+
+# Shared across HEAD probes so repeated hosts reuse the same keep-alive connection
+_SESSION = None
+if requests is not None:
+    _SESSION = requests.Session()
+    for _prefix in ("https://", "http://"):
+        _SESSION.mount(_prefix, HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=1))
+    _SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+
+# str(profile_dir) -> open lock file, held for the lifetime of the process
+_PROFILE_LOCKS = {}
+
+# chromedriver path resolved by ChromeDriverManager; the binary doesn't change during a run
+_DRIVER_PATH: Optional[str] = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+# Set on Ctrl-C so worker threads stop picking up links and in-flight waits bail out
+_STOP = threading.Event()
+
+
+def lock_profile_dir(profile_dir: Path) -> bool:
+    """Take an exclusive, non-blocking lock on profile_dir for the rest of this process.
+
+    Chrome refuses to share a user-data-dir between running instances, so a second
+    run must not point at the same profile. Returns False if another process holds it.
+    """
+    key = str(profile_dir)
+    if key in _PROFILE_LOCKS:
+        return True
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    fh = open(profile_dir / ".selenium_downloader.lock", "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        fh.close()
+        return False
+    _PROFILE_LOCKS[key] = fh
+    return True
 
 
-def setup_driver(download_dir: Path, headless: bool = True, disable_images: bool = True) -> webdriver.Chrome:
-    """Initialize Chrome driver with improved preferences and safe defaults."""
+def setup_driver(download_dir: Path, headless: bool = True, disable_images: bool = True,
+                 profile_dir: Optional[Path] = None) -> webdriver.Chrome:
+    """Initialize Chrome driver with improved preferences and safe defaults.
+
+    With profile_dir, Chrome keeps its HTTP cache there between runs (cookies are reset by soft_refresh).
+    """
     options = webdriver.ChromeOptions()
 
     prefs = {
@@ -72,15 +166,45 @@ def setup_driver(download_dir: Path, headless: bool = True, disable_images: bool
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_argument("--disable-extensions")
+    # keep timers and renderers running at full speed in headless/background tabs
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-ipc-flooding-protection")
+    # skip background services we never use
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-translate")
+    options.add_argument("--metrics-recording-only")
+    options.add_argument("--mute-audio")
+    options.add_argument("--no-first-run")
+    options.add_argument("--safebrowsing-disable-auto-update")
+    # driver.get() returns at DOMContentLoaded; element waits cover the rest
+    options.page_load_strategy = "eager"
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    # Page-domain CDP events (incl. download progress) are read back through the performance log
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": False, "enablePage": True})
 
     # Optionally block images to speed up page loads
     if disable_images:
         prefs["profile.managed_default_content_settings.images"] = 2
 
+    use_profile = False
+    if profile_dir is not None:
+        if lock_profile_dir(profile_dir):
+            options.add_argument(f"--user-data-dir={profile_dir}")
+            options.add_argument("--profile-directory=Default")
+            use_profile = True
+        else:
+            console.print(f"[yellow]⚠️ Profile {profile_dir} is in use by another run; using a temporary profile[/yellow]")
+
+    global _DRIVER_PATH
     try:
+        with _DRIVER_PATH_LOCK:
+            if _DRIVER_PATH is None:
+                _DRIVER_PATH = ChromeDriverManager().install()
         driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(_DRIVER_PATH),
             options=options,
         )
 
@@ -106,13 +230,213 @@ def setup_driver(download_dir: Path, headless: bool = True, disable_images: bool
             # not critical; continue
             pass
 
+        enable_download_events(driver, download_dir)
+
         return driver
 
     except Exception as e:
+        if use_profile:
+            # e.g. an orphaned Chrome from a dead chromedriver still holds the profile
+            console.print(f"[yellow]⚠️ Chrome failed to start with profile {profile_dir} ({e}); retrying with a temporary profile[/yellow]")
+            return setup_driver(download_dir, headless=headless, disable_images=disable_images, profile_dir=None)
         console.print(f"[red]❌ Failed to initialize Chrome driver: {e}[/red]")
         raise
 
 
+# chromedriver's performance log only carries Network/Page/Tracing events, so the
+# (deprecated but still emitted) Page.download* events are the only ones we can see
+DOWNLOAD_EVENTS = ("Page.downloadWillBegin", "Page.downloadProgress")
+
+
+def enable_download_events(driver: webdriver.Chrome, download_dir: Path) -> bool:
+    """Pin Chrome's download folder over CDP. Returns False if unsupported.
+
+    Uses behavior "allow" (not "allowAndName") so files keep their real names,
+    which check_file_exists relies on.
+    """
+    try:
+        driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+            "behavior": "allow",
+            "downloadPath": str(download_dir),
+        })
+        return True
+    except Exception:
+        return False
+
+
+def read_download_events(driver: webdriver.Chrome) -> List[tuple]:
+    """Drain the performance log and return (method, params) for download events only."""
+    events = []
+    for entry in driver.get_log("performance"):
+        try:
+            msg = json.loads(entry["message"])["message"]
+        except Exception:
+            continue
+        if msg.get("method") in DOWNLOAD_EVENTS:
+            events.append((msg["method"], msg.get("params", {})))
+    return events
+
+
+def wait_for_download_events(driver: webdriver.Chrome, download_dir: Path, before_files: set,
+                             timeout: int = 150, start_timeout: int = 10):
+    """
+    Wait for Chrome itself to report the download as completed.
+
+    Returns the suggested filename on completion, None if the download was
+    canceled or timed out, or False when the caller should fall back to watching
+    the folder: a new file showed up in download_dir without any download event,
+    or no progress event arrived within start_timeout seconds.
+    """
+    start = time.time()
+    names = {}
+    progress_seen = False
+    while time.time() - start < timeout and not _STOP.is_set():
+        try:
+            events = read_download_events(driver)
+        except Exception:
+            return False
+        for method, params in events:
+            guid = params.get("guid")
+            if method.endswith("downloadWillBegin"):
+                names[guid] = params.get("suggestedFilename")
+            elif guid in names:
+                # progress for a download that began before our click isn't ours
+                progress_seen = True
+                state = params.get("state")
+                if state == "completed":
+                    return names[guid]
+                if state == "canceled":
+                    return None
+        if not progress_seen:
+            if time.time() - start > start_timeout:
+                return False
+            # downloadWillBegin always precedes the file, so a new file with no events
+            # means this Chrome isn't reporting them: hand over to the folder watcher now
+            if not names:
+                try:
+                    if set(os.listdir(download_dir)) - before_files:
+                        return False
+                except OSError:
+                    pass
+        time.sleep(0.5)
+    return None
+
+
+def wait_for_page_ready(driver: webdriver.Chrome, timeout: int = DEFAULT_MAX_WAIT) -> bool:
+    """Wait until the DOM is parsed, instead of sleeping a fixed time.
+
+    Subresources (ads, images) are not waited for, matching the eager page-load strategy.
+    Returns False on timeout; callers carry on and let their own element waits decide.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+        )
+        return True
+    except Exception:
+        return False
+
+
+def soft_refresh(driver: webdriver.Chrome) -> None:
+    """Reset cookies and storage in place instead of restarting Chrome.
+
+    The HTTP cache is kept so static assets aren't refetched after every refresh.
+    """
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    driver.get("about:blank")
+
+
+def worker_dir(base_dir: Path, idx: int) -> Path:
+    """Per-worker download subfolder, so parallel downloads never see each other's files."""
+    return base_dir / f"worker_{idx}"
+
+
+def setup_driver_pool(n: int, base_dir: Path, headless: bool = True, disable_images: bool = True,
+                      start: int = 0, profile_root: Optional[Path] = None) -> List[webdriver.Chrome]:
+    """Start Chrome drivers for workers start..n-1, each downloading into its own base_dir/worker_{i} folder.
+
+    With profile_root, each worker also gets its own persistent profile_root/worker_{i}.
+    """
+    drivers: List[webdriver.Chrome] = []
+    try:
+        for i in range(start, n):
+            wdir = worker_dir(base_dir, i)
+            wdir.mkdir(parents=True, exist_ok=True)
+            profile_dir = worker_dir(profile_root, i) if profile_root else None
+            drivers.append(setup_driver(wdir, headless=headless, disable_images=disable_images, profile_dir=profile_dir))
+    except Exception:
+        for d in drivers:
+            try:
+                d.quit()
+            except Exception:
+                pass
+        raise
+    return drivers
+
+
+def free_download_path(download_dir: Path, name: str, reserved: set) -> Path:
+    """First of name, "name (1).ext", "name (2).ext", ... not on disk or in reserved (Chrome's scheme)."""
+    base, ext = os.path.splitext(name)
+    candidate, n = name, 0
+    while candidate in reserved or (download_dir / candidate).exists():
+        n += 1
+        candidate = f"{base} ({n}){ext}"
+    reserved.add(candidate)
+    return download_dir / candidate
+
+
+def collect_worker_downloads(base_dir: Path, n: int) -> int:
+    """Move finished files from the worker subfolders into base_dir.
+
+    Temp files (.crdownload/.part/.tmp) are left in place; a name that already exists
+    in base_dir gets a "name (1).ext" suffix. Returns the number of files moved.
+    """
+    moved = 0
+    for i in range(n):
+        wdir = worker_dir(base_dir, i)
+        if not wdir.is_dir():
+            continue
+        with os.scandir(wdir) as it:
+            finished = [e.name for e in it if e.is_file() and not e.name.endswith(('.crdownload', '.part', '.tmp'))]
+        for fn in finished:
+            src = wdir / fn
+            dst = free_download_path(base_dir, fn, set())
+            try:
+                shutil.move(str(src), str(dst))
+                moved += 1
+            except Exception as e:
+                console.print(f"[red]❌ Could not move {src}: {e}[/red]")
+        try:
+            wdir.rmdir()  # only succeeds when empty
+        except OSError:
+            pass
+    return moved
+
+
+# Prefer article-like blocks but fall back to generic anchors
+ARTICLE_SELECTORS = ["article", ".post", ".entry", ".paste-body", ".content"]
+
+# arguments[0]: ARTICLE_SELECTORS. Returns unique http(s) hrefs in document order.
+COLLECT_LINKS_JS = """
+    const sels = arguments[0];
+    let anchors = [];
+    for (const s of sels) {
+        const els = document.querySelectorAll(s + ' a[href]');
+        if (els.length) { anchors = Array.from(els); break; }
+    }
+    // final fallback: grab all anchors on page
+    if (!anchors.length) anchors = Array.from(document.querySelectorAll('a[href]'));
+    const seen = new Set();
+    const out = [];
+    for (const a of anchors) {
+        const h = a.href;
+        if (h && h.startsWith('http') && !seen.has(h)) { seen.add(h); out.push(h); }
+    }
+    return out;
+"""
+
+
 def scrape_links(driver: webdriver.Chrome, url: str, wait_time: int = DEFAULT_MAX_WAIT) -> List[str]:
     """Scrape download-page links from the main page.
 
@@ -126,43 +450,10 @@ def scrape_links(driver: webdriver.Chrome, url: str, wait_time: int = DEFAULT_MA
     try:
         # Wait for something that looks like content; broad fallback
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(1)
+        wait_for_page_ready(driver, wait_time)
 
-        # Prefer article-like blocks but fall back to generic anchors
-        article_selectors = ["article", ".post", ".entry", ".paste-body", ".content"]
-        anchors = []
-        for sel in article_selectors:
-            try:
-                articles = driver.find_elements(By.CSS_SELECTOR, sel)
-                if not articles:
-                    continue
-                for a in articles:
-                    anchors.extend(a.find_elements(By.CSS_SELECTOR, "a[href]"))
-                if anchors:
-                    break
-            except Exception:
-                continue
-
-        # final fallback: grab all anchors on page
-        if not anchors:
-            anchors = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-
-        for a in anchors:
-            try:
-                href = a.get_attribute("href")
-                if href and href.startswith("http"):
-                    links.append(href)
-            except Exception:
-                continue
-
-        # Keep order unique
-        seen = set()
-        unique = []
-        for l in links:
-            if l not in seen:
-                seen.add(l)
-                unique.append(l)
-        links = unique
+        # Anchor lookup, http filter and order-preserving dedup all happen in one script call
+        links = list(driver.execute_script(COLLECT_LINKS_JS, ARTICLE_SELECTORS) or [])
 
         console.print(f"[green]📄 Found {len(links)} links (raw).[/green]")
 
@@ -173,22 +464,106 @@ def scrape_links(driver: webdriver.Chrome, url: str, wait_time: int = DEFAULT_MA
     return links
 
 
+TEMP_EXTS = ('.crdownload', '.part', '.tmp')
+
+
 def get_incomplete_files(download_dir: Path) -> List[str]:
     files = []
     try:
-        for f in os.listdir(download_dir):
-            if f.endswith(('.part', '.tmp')):
-                files.append(f)
+        with os.scandir(download_dir) as it:
+            for entry in it:
+                if entry.name.endswith(TEMP_EXTS):
+                    files.append(entry.name)
     except Exception:
         pass
     return files
 
 
+def purge_stale_partials(download_dir: Path, max_age: float = STALE_PARTIAL_AGE) -> List[str]:
+    """Delete temp download files that haven't been written to for max_age seconds.
+
+    Only call this on a worker_<i> folder: it removes every .crdownload/.part/.tmp there.
+
+    Chrome can't resume a .crdownload left behind by a browser process that is gone,
+    and check_file_exists would otherwise treat it as "already downloading" forever.
+    Returns the removed filenames.
+    """
+    removed = []
+    now = time.time()
+    for fn in get_incomplete_files(download_dir):
+        fp = download_dir / fn
+        try:
+            if now - fp.stat().st_mtime >= max_age:
+                fp.unlink()
+                removed.append(fn)
+        except OSError:
+            pass
+    return removed
+
+# str(dir) -> (st_mtime_ns, names); a directory's mtime changes whenever an entry is added/removed/renamed
+_LISTDIR_CACHE = {}
+# Don't trust an mtime this recent: a change in the same timestamp tick would go unnoticed
+_LISTDIR_RACY_NS = 2_000_000_000
+
+
+def _cached_listdir(path: Path) -> tuple:
+    """os.listdir(path), reused while the directory's mtime is unchanged."""
+    key = str(path)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _LISTDIR_CACHE.get(key)
+    if cached and cached[0] == mtime and time.time_ns() - mtime > _LISTDIR_RACY_NS:
+        return cached[1]
+    names = tuple(os.listdir(key))
+    _LISTDIR_CACHE[key] = (mtime, names)
+    return names
+
+
+class DownloadEventHandler(PatternMatchingEventHandler):
+    """Wakes the download waiter as soon as a file reaches its final name.
+
+    Chrome writes into name.crdownload and renames it when done, so the
+    rename (or a non-temp file being created directly) is the signal.
+    """
+
+    def __init__(self, patterns: List[str]):
+        super().__init__(patterns=patterns, ignore_directories=True, case_sensitive=False)
+        self.finished = threading.Event()
+
+    def on_created(self, event):
+        if not event.src_path.endswith(TEMP_EXTS):
+            self.finished.set()
+
+    def on_moved(self, event):
+        if not event.dest_path.endswith(TEMP_EXTS):
+            self.finished.set()
+
+
+def start_download_watcher(download_dir: Path, target_url: Optional[str] = None):
+    """Start a watchdog observer on download_dir. Returns (observer, handler) or None."""
+    if Observer is None:
+        return None
+    patterns = [f"*{e}" for e in TEMP_EXTS]
+    hint = get_filename_from_url(target_url) if target_url else None
+    ext = os.path.splitext(hint)[1] if hint else ""
+    patterns.append(f"*{ext}" if ext else "*")
+    try:
+        handler = DownloadEventHandler(patterns)
+        observer = Observer()
+        observer.schedule(handler, str(download_dir), recursive=False)
+        observer.start()
+        return observer, handler
+    except Exception:
+        return None
+
+
 def wait_for_download_complete(download_dir: Path, before_files: set, target_url: Optional[str] = None,
-                               timeout: int = 150, stable_checks: int = 3) -> Optional[str]:
+                               timeout: int = 150, prefix: str = "") -> Optional[str]:
     """
     Wait for Chrome to finish a download or detect an already-completed file.
     Also supports Chrome duplicate naming (Forza (1).rar, etc.)
+
+    Uses watchdog filesystem events when available so we wake up on the final
+    rename instead of the next poll tick; otherwise polls the folder.
     """
     start = time.time()
 
@@ -196,56 +571,74 @@ def wait_for_download_complete(download_dir: Path, before_files: set, target_url
     if target_url:
         existing = check_file_exists(download_dir, target_url)
         if existing:
-            console.print(f"[yellow]⏭️ Already downloaded earlier: {existing}[/yellow]")
+            console.print(f"  {prefix}[yellow]⏭️ Already downloaded earlier: {existing}[/yellow]")
             return existing
 
-    while time.time() - start < timeout:
-        try:
-            current = set(os.listdir(download_dir))
-        except Exception:
-            current = set()
+    watcher = start_download_watcher(download_dir, target_url)
+    handler = watcher[1] if watcher else None
 
-        new_files = current - before_files
+    def idle(seconds: float) -> None:
+        if handler is None:
+            time.sleep(seconds)
+            return
+        # Sleep until the next rename/create event; the cap is only a safety net for missed events
+        remaining = timeout - (time.time() - start)
+        handler.finished.wait(max(0.0, min(remaining, 5)))
+        handler.finished.clear()
 
-        # Wait for any temporary files to disappear
-        incomplete = [f for f in new_files if f.endswith(('.crdownload', '.part', '.tmp'))]
-        if incomplete:
-            time.sleep(1.5)
-            continue
+    try:
+        while time.time() - start < timeout and not _STOP.is_set():
+            # scandir hands back DirEntry objects, so the size check below needs no extra stat
+            entries = {}
+            try:
+                with os.scandir(download_dir) as it:
+                    for entry in it:
+                        if entry.name not in before_files:
+                            entries[entry.name] = entry
+            except Exception:
+                pass
 
-        # Completed file detected
-        if new_files:
-            for fn in list(new_files):
-                fp = download_dir / fn
-                if not fp.exists():
-                    continue
-                size = os.path.getsize(fp)
-                stable = True
-                for _ in range(stable_checks):
-                    time.sleep(1)
+            new_files = set(entries)
+
+            # Wait for any temporary files to disappear
+            incomplete = [f for f in new_files if f.endswith(TEMP_EXTS)]
+            if incomplete:
+                idle(1.5)
+                continue
+
+            # Completed file detected
+            if new_files:
+                for fn, entry in entries.items():
+                    # Chrome no longer touches the file after the rename: one short window is enough
                     try:
-                        new_size = os.path.getsize(fp)
-                    except Exception:
-                        new_size = size
-                    if new_size != size:
-                        stable = False
-                        size = new_size
-                        break
-                if stable:
-                    return fn
-
-        # Also check for previously completed version mid-loop
-        if target_url:
-            existing = check_file_exists(download_dir, target_url)
-            if existing:
-                return existing
-
-        time.sleep(1)
+                        s1 = entry.stat()
+                        time.sleep(0.5)
+                        s2 = os.stat(entry.path)
+                    except OSError:
+                        continue
+                    if s1.st_size == s2.st_size and s1.st_mtime == s2.st_mtime:
+                        return fn
+
+            # Also check for previously completed version mid-loop
+            if target_url:
+                existing = check_file_exists(download_dir, target_url)
+                if existing:
+                    return existing
+
+            idle(1)
+    finally:
+        if watcher:
+            try:
+                watcher[0].stop()
+                watcher[0].join(timeout=2)
+            except Exception:
+                pass
 
     return None
 
 
 
+@functools.lru_cache(maxsize=8192)
 def get_filename_from_url(url: str) -> Optional[str]:
     """
     Robust filename extractor:
@@ -254,6 +647,7 @@ def get_filename_from_url(url: str) -> Optional[str]:
       3) Falls back to fragment (rare)
       4) As last resort tries a HEAD request and parses Content-Disposition header
     Returns: filename with extension (e.g. 'game.rar') or None if not determinable.
+    Results are memoized per URL, so the HEAD request is made at most once.
     """
     if not url:
         return None
@@ -287,12 +681,12 @@ def get_filename_from_url(url: str) -> Optional[str]:
 
         # 4) HEAD request -> Content-Disposition (last resort; optional)
         try:
-            import requests
-            head = requests.head(url, allow_redirects=True, timeout=5)
+            if _SESSION is None:
+                return None
+            head = _SESSION.head(url, allow_redirects=True, timeout=5)
             cd = head.headers.get("content-disposition")
             if cd:
-                # filename*=UTF-8''%e2%82%ac%20rates  or filename="name.ext"
-                m = re.search(r"filename\*\s*=\s*([^;]+)", cd, flags=re.I)
+                m = _CD_FILENAME_STAR.search(cd)
                 if m:
                     fname = m.group(1).strip().strip("\"'")
                     # handle RFC5987 (e.g. UTF-8''... percent-encoded)
@@ -305,7 +699,7 @@ def get_filename_from_url(url: str) -> Optional[str]:
                     if "." in fname:
                         return fname
 
-                m2 = re.search(r'filename\s*=\s*"?(?P<name>[^\";]+)"?', cd, flags=re.I)
+                m2 = _CD_FILENAME.search(cd)
                 if m2:
                     fname = m2.group("name").strip().strip("\"'")
                     fname = unquote(fname)
@@ -360,17 +754,34 @@ def get_filename_from_url(url: str) -> Optional[str]:
 
 #     return None
 
-def check_file_exists(download_dir: Path, url: str) -> Optional[str]:
+@functools.lru_cache(maxsize=4096)
+def _build_name_pattern(base: str, ext: str) -> "re.Pattern":
+    """
+    Build a case-insensitive regex matching:
+      - exact "base.ext"
+      - "base (1).ext", "base (2).ext", etc.
+      - those + temp extensions like .crdownload/.part/.tmp appended
+    """
+    # escape base for regex but allow spaces/percent-encodings etc in actual filenames
+    esc_base = re.escape(base)
+    return re.compile(rf"^{esc_base}(?:\s*\(\d+\))?{re.escape(ext)}(?:\.crdownload|\.part|\.tmp)?$", flags=re.I)
+
+
+def check_file_exists(download_dir: Path, url: str, hint: Optional[str] = None,
+                      names: Optional[tuple] = None) -> Optional[str]:
     """
     Detect if the target (completed or in-progress) file already exists.
     Handles:
       - exact names (game.rar)
       - browser temp variants (game.rar.crdownload, game.rar.part, game.rar.tmp)
       - duplicate suffixes added by browser (game (1).rar, game (1).rar.crdownload)
+    Pass hint (the already-resolved filename) to skip get_filename_from_url, and
+    names (a listing of download_dir) when checking many links against one folder.
     Returns the matching filename found in the folder (string) or None.
     """
     try:
-        hint = get_filename_from_url(url)
+        if hint is None:
+            hint = get_filename_from_url(url)
         if not hint:
             return None
 
@@ -382,31 +793,31 @@ def check_file_exists(download_dir: Path, url: str) -> Optional[str]:
         if not ext:
             return None
 
-        # Build a regex to match:
-        #   - exact "base.ext"
-        #   - "base (1).ext", "base (2).ext", etc.
-        #   - those + temp extensions like .crdownload/.part/.tmp appended
-        # Use case-insensitive matching
-        # escape base for regex but allow spaces/percent-encodings etc in actual filenames
-        esc_base = re.escape(base)
-        pattern = re.compile(rf"^{esc_base}(?:\s*\(\d+\))?{re.escape(ext)}(?:\.crdownload|\.part|\.tmp)?$", flags=re.I)
+        pattern = _build_name_pattern(base, ext)
 
-        for fname in os.listdir(download_dir):
+        # One pass over a single listing: a strict match wins, otherwise return the first
+        # fallback match (base anywhere in the stem, same extension or a known temp extension).
+        fallback_exts = [(ext + t).lower() for t in ("",) + TEMP_EXTS]
+        base_l = base.lower()
+        fallback = None
+        if names is None:
+            names = _cached_listdir(download_dir)
+        for fname in names:
             if pattern.match(fname):
                 return fname
-
-        # As a fallback, allow base to appear anywhere in the stem (helps with slight variations)
-        # but still require same extension or a known temp extension.
-        fallback_exts = [ext, ext + ".crdownload", ext + ".part", ext + ".tmp"]
-        for fname in os.listdir(download_dir):
-            lf = fname.lower()
-            for fe in fallback_exts:
-                if lf.endswith(fe.lower()):
-                    stem = lf[: -len(fe)]
-                    # remove trailing ' (1)' etc for comparison
-                    stem_clean = re.sub(r"\s*\(\d+\)$", "", stem).strip()
-                    if base.lower() in stem_clean:
-                        return fname
+            if fallback is None:
+                lf = fname.lower()
+                for fe in fallback_exts:
+                    if lf.endswith(fe):
+                        stem = lf[: -len(fe)]
+                        # remove trailing ' (1)' etc for comparison
+                        stem_clean = _DUP_SUFFIX_RE.sub("", stem).strip()
+                        if base_l in stem_clean:
+                            fallback = fname
+                            break
+
+        if fallback:
+            return fallback
 
         return None
 
@@ -414,19 +825,22 @@ def check_file_exists(download_dir: Path, url: str) -> Optional[str]:
         return None
 
 
+# Try several sensible selectors (both CSS and XPath)
+DOWNLOAD_BUTTON_SELECTORS = [
+    (By.CSS_SELECTOR, "button.gay-button"),
+    (By.CSS_SELECTOR, "button.link-button"),
+    (By.CSS_SELECTOR, "button[class*='gay-button']"),
+    (By.XPATH, "//button[contains(@class, 'gay-button') or contains(., 'DOWNLOAD') or contains(., 'Download') or contains(., 'download')]") ,
+    (By.CSS_SELECTOR, "a[href][class*='download']"),
+    (By.CSS_SELECTOR, "a[href*='download']"),
+    (By.XPATH, "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'download')]")
+]
+
+REMOVE_OVERLAYS_JS = "document.querySelectorAll(\"div[style*='z-index'][style*='fixed']\").forEach(e => e.remove());"
+
+
 def find_download_button(driver: webdriver.Chrome, wait: WebDriverWait):
-    # Try several sensible selectors (both CSS and XPath)
-    selectors = [
-        (By.CSS_SELECTOR, "button.gay-button"),
-        (By.CSS_SELECTOR, "button.link-button"),
-        (By.CSS_SELECTOR, "button[class*='gay-button']"),
-        (By.XPATH, "//button[contains(@class, 'gay-button') or contains(., 'DOWNLOAD') or contains(., 'Download') or contains(., 'download')]") ,
-        (By.CSS_SELECTOR, "a[href][class*='download']"),
-        (By.CSS_SELECTOR, "a[href*='download']"),
-        (By.XPATH, "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'),'download')]")
-    ]
-
-    for by, sel in selectors:
+    for by, sel in DOWNLOAD_BUTTON_SELECTORS:
         try:
             el = wait.until(EC.element_to_be_clickable((by, sel)))
             return el
@@ -435,9 +849,11 @@ def find_download_button(driver: webdriver.Chrome, wait: WebDriverWait):
     return None
 
 
-def click_download_button(driver: webdriver.Chrome, page_url: str, download_dir: Path, max_wait: int = DEFAULT_MAX_WAIT) -> object:
+def click_download_button(driver: webdriver.Chrome, page_url: str, download_dir: Path, max_wait: int = DEFAULT_MAX_WAIT,
+                          prefix: str = "") -> object:
     """Open page_url, attempt to click download and wait for completion.
 
+    prefix is put in front of every status line so parallel workers' output can be told apart.
     Returns True on success, False on failure, or 'SESSION_EXPIRED' if session needs restart.
     """
     try:
@@ -447,62 +863,67 @@ def click_download_button(driver: webdriver.Chrome, page_url: str, download_dir:
         except Exception:
             return "SESSION_EXPIRED"
 
-        console.print("  [cyan]🔗 Opening page...[/cyan]")
+        console.print(f"  {prefix}[cyan]🔗 Opening page...[/cyan]")
         driver.get(page_url)
         wait = WebDriverWait(driver, max_wait)
-        time.sleep(1)
+        wait_for_page_ready(driver, max_wait)
 
-        # attempt to remove obvious overlays
+        # attempt to remove obvious overlays (one in-page call instead of a round-trip per element)
         try:
-            overlays = driver.find_elements(By.CSS_SELECTOR, "div[style*='z-index'][style*='fixed']")
-            for o in overlays:
-                try:
-                    driver.execute_script("arguments[0].remove();", o)
-                except Exception:
-                    pass
+            driver.execute_script(REMOVE_OVERLAYS_JS)
         except Exception:
             pass
 
         btn = find_download_button(driver, wait)
         if not btn:
-            console.print("  [red]❌ Could not find download button[/red]")
+            console.print(f"  {prefix}[red]❌ Could not find download button[/red]")
             return False
 
-        files_before = set(os.listdir(download_dir))
-        console.print("  [cyan]🖱️ Clicking download button...[/cyan]")
-
-        clicked = False
+        files_before = set(_cached_listdir(download_dir))
         try:
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-            time.sleep(0.5)
-            driver.execute_script("arguments[0].click();", btn)
-            clicked = True
+            read_download_events(driver)  # discard events from earlier pages
         except Exception:
             pass
+        console.print(f"  {prefix}[cyan]🖱️ Clicking download button...[/cyan]")
 
-        if not clicked:
-            try:
-                from selenium.webdriver.common.action_chains import ActionChains
-                actions = ActionChains(driver)
-                actions.move_to_element(btn).click().perform()
-                clicked = True
-            except Exception:
-                pass
-
-        if not clicked:
+        try:
+            # One call: scroll the button into view (instant, so a CSS smooth scroll can't leave
+            # the rect stale) and check it is what sits at its centre. If an ad layer covers it,
+            # a coordinate click would hit the ad, so click the element directly instead.
+            point = driver.execute_script(
+                "const btn = arguments[0];"
+                "btn.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});"
+                "const r = btn.getBoundingClientRect();"
+                "const x = r.left + r.width / 2, y = r.top + r.height / 2;"
+                "const hit = document.elementFromPoint(x, y);"
+                "if (hit !== btn && !btn.contains(hit)) { btn.click(); return null; }"
+                "return [x, y];",
+                btn,
+            )
+            if point:
+                cx, cy = point
+                for event_type in ("mouseMoved", "mousePressed", "mouseReleased"):
+                    params = {"type": event_type, "x": cx, "y": cy}
+                    if event_type != "mouseMoved":
+                        params.update(button="left", clickCount=1)
+                    driver.execute_cdp_cmd("Input.dispatchMouseEvent", params)
+        except Exception:
+            # CDP input failed; plain WebDriver click as a last resort
             try:
                 btn.click()
-                clicked = True
             except Exception as e:
-                console.print(f"  [red]❌ Click failed: {e}[/red]")
+                console.print(f"  {prefix}[red]❌ Click failed: {e}[/red]")
                 return False
 
-        # Wait for new file to appear & complete
-        completed = wait_for_download_complete(download_dir, files_before, target_url=page_url, timeout=150)
+        # Chrome knows when the download finishes; only watch the folder if it doesn't tell us
+        completed = wait_for_download_events(driver, download_dir, files_before, timeout=150)
+        if completed is False:
+            completed = wait_for_download_complete(download_dir, files_before, target_url=page_url, timeout=150,
+                                                   prefix=prefix)
 
 
         if completed:
-            console.print(f"  [green]✅ Downloaded: {completed}[/green]")
+            console.print(f"  {prefix}[green]✅ Downloaded: {completed}[/green]")
             # Auto-extract if it's a rar
             # completed_path = download_dir / completed
             # if completed_path.suffix.lower() == ".rar":
@@ -511,13 +932,13 @@ def click_download_button(driver: webdriver.Chrome, page_url: str, download_dir:
             #     console.print(f"  [green]📂 Extracted to: {extract_dir}[/green]")
             # else:
             #     console.print(f"  [yellow]⚠️ Extraction failed for: {completed}[/yellow]")
-            # return True
-        else:
-         console.print("  [yellow]⚠️ Download timeout or didn't start[/yellow]")
+            return True
+
+        console.print(f"  {prefix}[yellow]⚠️ Download timeout or didn't start[/yellow]")
         return False
 
     except Exception as e:
-        console.print(f"  [red]❌ Error: {e}[/red]")
+        console.print(f"  {prefix}[red]❌ Error: {e}[/red]")
         if "invalid session id" in str(e).lower() or "session" in str(e).lower():
             return "SESSION_EXPIRED"
         return False
@@ -562,13 +983,99 @@ def read_urls_from_txt(file_path: str) -> list[str]:
 #         return False
 
 
+def prepare_links(links: List[str], filter_downloads: bool) -> List[str]:
+    """Deduplicate the combined link list and optionally keep only likely download pages."""
+    # the only dedup pass: scrape_links already returns unique hrefs, this merges the two sources
+    links = list(dict.fromkeys(links))
+
+    # optionally filter to plausible download pages (simple heuristic)
+    # If user set --filter-downloads, try to keep only links containing 'download' or 'dl'
+    if filter_downloads:
+        filtered = [l for l in links if any(k in l.lower() for k in ("download", "dl", "fitgirl", "torrent", "drive"))]
+        if filtered:
+            links = filtered
+    return links
+
+
+def resolve_filenames(links: List[str], max_workers: int = 16) -> dict:
+    """Map each link to get_filename_from_url(link), resolving in parallel.
+
+    Most links resolve from the URL alone, but HEAD fallbacks can take seconds each;
+    doing them all up front keeps them out of the download loop.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return dict(zip(links, ex.map(get_filename_from_url, links)))
+
+
+def pending_links(download_dir: Path, links: List[str], name_map: dict) -> List[str]:
+    """Report links whose file is already in download_dir and return the rest."""
+    # one listing for the whole batch; the mtime cache is bypassed right after we touched the folder
+    try:
+        names = tuple(os.listdir(download_dir))
+    except OSError:
+        names = ()
+    existing_map = {l: check_file_exists(download_dir, l, hint=name_map.get(l) or "", names=names) for l in links}
+    for existing in existing_map.values():
+        if not existing:
+            continue
+        try:
+            size_mb = os.path.getsize(download_dir / existing) / (1024 * 1024)
+            console.print(f"  [yellow]⏭️  File already exists: {existing} ({size_mb:.1f}MB)[/yellow]")
+        except Exception:
+            console.print(f"  [yellow]⏭️  File already exists: {existing}[/yellow]")
+    return [l for l, e in existing_map.items() if not e]
+
+
+def make_progress() -> Progress:
+    return Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40, style="cyan", complete_style="green"),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("•"),
+        TextColumn("[cyan]{task.completed}/{task.total}"),
+        TextColumn("•"),
+        TextColumn("[green]✅  {task.fields[success]}"),
+        TextColumn("[yellow]⏭️  {task.fields[skipped]}"),
+        TextColumn("[red]❌ {task.fields[failed]}"),
+        console=console,
+    )
+
+
+def print_summary(total: int, successful: int, skipped: int, failed: int, download_dir: Path) -> None:
+    """Print the final download summary table."""
+    console.print("\n")
+    table = Table(title="📊 Download Summary", box=box.ROUNDED, border_style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Count", justify="right")
+    table.add_column("Percentage", justify="right")
+
+    table.add_row("✅ Downloaded", str(successful), f"{successful/total*100:.1f}%", style="green")
+    table.add_row("⏭️ Skipped (exist)", str(skipped), f"{skipped/total*100:.1f}%", style="yellow")
+    table.add_row("❌ Failed", str(failed), f"{failed/total*100:.1f}%", style="red")
+    table.add_row("[dim]" + "─" * 15 + "[/dim]", "[dim]─" * 8 + "[/dim]", "[dim]─" * 10 + "[/dim]")
+
+    total_available = successful + skipped
+    table.add_row("📈 Total Available", str(total_available), f"{total_available/total*100:.1f}%", style="bold cyan")
+
+    console.print(table)
+    console.print(f"\n[cyan]📁 Download location: {download_dir}[/cyan]")
+
+
 def run(args):
     download_dir = Path(args.output).expanduser().absolute()
     download_dir.mkdir(parents=True, exist_ok=True)
 
-    driver = None
+    # Chrome throttles simultaneous downloads, so more workers than this just queue up
+    workers = max(1, min(args.workers, MAX_WORKERS))
+    profile_root = None if args.fresh_profile else Path(args.profile_dir).expanduser().absolute()
+    drivers: List[webdriver.Chrome] = []
     try:
-        driver = setup_driver(download_dir, headless=args.headless, disable_images=not args.no_image_block)
+        # pick up anything a previous (interrupted) run left in the worker folders
+        collect_worker_downloads(download_dir, MAX_WORKERS)
+        # only the worker folders: they belong to this script, while --output may hold other tools' partials
+        for d in [worker_dir(download_dir, i) for i in range(MAX_WORKERS)]:
+            for fn in purge_stale_partials(d):
+                console.print(f"[dim]🧹 Removed stale partial download: {fn}[/dim]")
         links = []
 
 # 1️⃣ If input-txt provided, load URLs from it
@@ -578,19 +1085,13 @@ def run(args):
 # 2️⃣ If --url also provided, scrape that page for links
         if args.url:
             console.print(f"[cyan]🌐 Scraping main page: {args.url}[/cyan]")
-            page_links = scrape_links(driver, args.url, wait_time=args.max_wait)
+            # this browser is reused as worker 0 if anything needs downloading
+            drivers.extend(setup_driver_pool(1, download_dir, headless=args.headless, disable_images=not args.no_image_block,
+                                             profile_root=profile_root))
+            page_links = scrape_links(drivers[0], args.url, wait_time=args.max_wait)
             links.extend(page_links)
 
-# Deduplicate
-        links = list(dict.fromkeys(links))
-
-        # optionally filter to plausible download pages (simple heuristic)
-        # If user set --filter-downloads, try to keep only links containing 'download' or 'dl'
-        if args.filter_downloads:
-            filtered = [l for l in links if any(k in l.lower() for k in ("download", "dl", "fitgirl", "torrent", "drive"))]
-            if filtered:
-                links = filtered
-
+        links = prepare_links(links, args.filter_downloads)
         if not links:
             console.print("[red]❌ No links found![/red]")
             return
@@ -598,92 +1099,118 @@ def run(args):
         console.print(f"\n[green]📋 Found {len(links)} candidate links[/green]")
         console.print(f"[cyan]📁 Download directory: {download_dir}[/cyan]")
 
+        # Resolve what's already on disk up front, so a fully resumed batch never launches Chrome at all
+        name_map = resolve_filenames(links)
+        pending = pending_links(download_dir, links, name_map)
+
         successful = 0
         failed = 0
-        skipped = 0
-        downloads_since_refresh = 0
-
-        with Progress(
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=40, style="cyan", complete_style="green"),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("•"),
-            TextColumn("[cyan]{task.completed}/{task.total}"),
-            TextColumn("•"),
-            TextColumn("[green]✅  {task.fields[success]}"),
-            TextColumn("[yellow]⏭️  {task.fields[skipped]}"),
-            TextColumn("[red]❌ {task.fields[failed]}"),
-            console=console,
-        ) as progress:
-            main_task = progress.add_task("[cyan]Overall Progress", total=len(links), success=0, skipped=0, failed=0)
-
-            for idx, link in enumerate(links, 1):
-                console.print(f"\n[bold][dim]{'─'*60}[/dim][/bold]")
-                filename = get_filename_from_url(link) or link[:60]
-                console.print(f"[bold cyan][{idx}/{len(links)}][/bold cyan] {filename}")
-
-                existing = check_file_exists(download_dir, link)
-                if existing:
-                    try:
-                        size_mb = os.path.getsize(download_dir / existing) / (1024 * 1024)
-                        console.print(f"  [yellow]⏭️  File already exists: {existing} ({size_mb:.1f}MB)[/yellow]")
-                    except Exception:
-                        console.print(f"  [yellow]⏭️  File already exists: {existing}[/yellow]")
-                    skipped += 1
-                    progress.update(main_task, advance=1, success=successful, skipped=skipped, failed=failed)
-                    continue
-
-                if downloads_since_refresh >= args.session_refresh:
-                    console.print("  [yellow]🔄 Refreshing browser session...[/yellow]")
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
-                    time.sleep(1)
-                    driver = setup_driver(download_dir, headless=args.headless, disable_images=not args.no_image_block)
-                    downloads_since_refresh = 0
-
-                result = click_download_button(driver, link, download_dir, max_wait=args.max_wait)
-                if result == "SESSION_EXPIRED":
-                    console.print("  [yellow]🔄 Restarting browser session (expired)...[/yellow]")
-                    try:
-                        driver.quit()
-                    except Exception:
-                        pass
-                    time.sleep(1)
-                    driver = setup_driver(download_dir, headless=args.headless, disable_images=not args.no_image_block)
-                    downloads_since_refresh = 0
-                    result = click_download_button(driver, link, download_dir, max_wait=args.max_wait)
-
-                if result is True:
-                    successful += 1
-                    downloads_since_refresh += 1
-                else:
-                    failed += 1
-
-                progress.update(main_task, advance=1, success=successful, skipped=skipped, failed=failed)
-
-                if idx < len(links):
-                    time.sleep(args.delay_between)
+        skipped = len(links) - len(pending)
+
+        if not pending:
+            console.print("[green]✅ Everything is already downloaded[/green]")
+            print_summary(len(links), successful, skipped, failed, download_dir)
+            return
 
-        # Summary
-        console.print("\n")
-        table = Table(title="📊 Download Summary", box=box.ROUNDED, border_style="cyan")
-        table.add_column("Status", style="bold")
-        table.add_column("Count", justify="right")
-        table.add_column("Percentage", justify="right")
+        drivers.extend(setup_driver_pool(workers, download_dir, headless=args.headless,
+                                         disable_images=not args.no_image_block, start=len(drivers),
+                                         profile_root=profile_root))
+        console.print(f"[cyan]🧵 Workers: {workers}[/cyan]")
 
-        total = len(links)
-        table.add_row("✅ Downloaded", str(successful), f"{successful/total*100:.1f}%", style="green")
-        table.add_row("⏭️ Skipped (exist)", str(skipped), f"{skipped/total*100:.1f}%", style="yellow")
-        table.add_row("❌ Failed", str(failed), f"{failed/total*100:.1f}%", style="red")
-        table.add_row("[dim]" + "─" * 15 + "[/dim]", "[dim]─" * 8 + "[/dim]", "[dim]─" * 10 + "[/dim]")
+        downloads_since_refresh = [0] * workers
+        counts_lock = threading.Lock()
 
-        total_available = successful + skipped
-        table.add_row("📈 Total Available", str(total_available), f"{total_available/total*100:.1f}%", style="bold cyan")
+        # Each task checks a driver slot out of the queue and puts it back when done
+        free_slots: "queue.Queue[int]" = queue.Queue()
+        for i in range(workers):
+            free_slots.put(i)
 
-        console.print(table)
-        console.print(f"\n[cyan]📁 Download location: {download_dir}[/cyan]")
+        with make_progress() as progress:
+            main_task = progress.add_task("[cyan]Overall Progress", total=len(links), completed=skipped,
+                                          success=0, skipped=skipped, failed=0)
+
+            def process_link(idx: int, link: str) -> None:
+                nonlocal successful, failed
+                if _STOP.is_set():
+                    return
+                filename = name_map[link] or link[:60]
+                console.print(f"[bold cyan][{idx}/{len(pending)}][/bold cyan] {filename}")
+
+                slot = free_slots.get()
+                try:
+                    if _STOP.is_set():
+                        return
+                    prefix = f"[dim]#{idx} w{slot}[/dim] "
+                    wdir = worker_dir(download_dir, slot)
+                    wprofile = worker_dir(profile_root, slot) if profile_root else None
+                    if downloads_since_refresh[slot] >= args.session_refresh:
+                        console.print(f"  {prefix}[yellow]🔄 Refreshing browser session...[/yellow]")
+                        try:
+                            soft_refresh(drivers[slot])
+                        except Exception:
+                            # soft refresh failed; fall back to a full restart
+                            try:
+                                drivers[slot].quit()
+                            except Exception:
+                                pass
+                            purge_stale_partials(wdir, max_age=0)
+                            drivers[slot] = setup_driver(wdir, headless=args.headless, disable_images=not args.no_image_block,
+                                                         profile_dir=wprofile)
+                        downloads_since_refresh[slot] = 0
+
+                    result = click_download_button(drivers[slot], link, wdir, max_wait=args.max_wait, prefix=prefix)
+                    if result == "SESSION_EXPIRED":
+                        console.print(f"  {prefix}[yellow]🔄 Restarting browser session (expired)...[/yellow]")
+                        try:
+                            drivers[slot].quit()
+                        except Exception:
+                            pass
+                        # this worker's in-flight partials died with the browser
+                        purge_stale_partials(wdir, max_age=0)
+                        time.sleep(1)
+                        drivers[slot] = setup_driver(wdir, headless=args.headless, disable_images=not args.no_image_block,
+                                                     profile_dir=wprofile)
+                        downloads_since_refresh[slot] = 0
+                        result = click_download_button(drivers[slot], link, wdir, max_wait=args.max_wait, prefix=prefix)
+
+                    if result is True:
+                        downloads_since_refresh[slot] += 1
+
+                    with counts_lock:
+                        if result is True:
+                            successful += 1
+                        else:
+                            failed += 1
+                        progress.update(main_task, advance=1, success=successful, skipped=skipped, failed=failed)
+
+                    time.sleep(args.delay_between)
+                finally:
+                    free_slots.put(slot)
+
+            _STOP.clear()
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [executor.submit(process_link, idx, link) for idx, link in enumerate(pending, 1)]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        console.print(f"  [red]❌ Worker error: {e}[/red]")
+                        with counts_lock:
+                            failed += 1
+                            progress.update(main_task, advance=1, success=successful, skipped=skipped, failed=failed)
+            except KeyboardInterrupt:
+                # don't let the executor run the rest of the queue; the finally below quits the drivers
+                _STOP.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown(wait=True)
+
+        moved = collect_worker_downloads(download_dir, workers)
+        if moved:
+            console.print(f"[dim]📦 Moved {moved} file(s) from worker folders[/dim]")
+
+        print_summary(len(links), successful, skipped, failed, download_dir)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]⚠️ Script interrupted by user[/yellow]")
@@ -692,12 +1219,136 @@ def run(args):
         import traceback
         traceback.print_exc()
     finally:
+        closed = False
+        for d in drivers:
+            try:
+                d.quit()
+                closed = True
+            except Exception:
+                pass
+        if closed:
+            console.print("[dim]🔒 Browser closed[/dim]")
+
+
+async def find_download_button_async(page, max_wait: int = DEFAULT_MAX_WAIT):
+    """Playwright counterpart of find_download_button, using the same selectors."""
+    for by, sel in DOWNLOAD_BUTTON_SELECTORS:
+        loc = page.locator(f"xpath={sel}" if by == By.XPATH else sel).first
         try:
-            if driver:
-                driver.quit()
-                console.print("[dim]🔒 Browser closed[/dim]")
+            await loc.wait_for(state="visible", timeout=max_wait * 1000)
+            return loc
         except Exception:
-            pass
+            continue
+    return None
+
+
+async def run_async(args):
+    """--async mode: one Chromium process, one isolated BrowserContext per in-flight link.
+
+    Playwright's expect_download() reports the finished download directly, so no
+    folder watching is needed; files are saved straight into the output directory.
+    Every link gets a fresh context, so --profile-dir and --session-refresh don't apply.
+    """
+    if async_playwright is None:
+        console.print("[red]❌ --async needs playwright: pip install playwright && playwright install chromium[/red]")
+        return
+
+    download_dir = Path(args.output).expanduser().absolute()
+    download_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(args.workers, MAX_WORKERS))
+
+    async with async_playwright() as p:
+        # blink setting instead of a route handler: routing every request through Python costs more than the images
+        launch_args = [] if args.no_image_block else ["--blink-settings=imagesEnabled=false"]
+        browser = await p.chromium.launch(headless=args.headless, args=launch_args)
+        try:
+            links = []
+            if args.input_txt:
+                links.extend(read_urls_from_txt(args.input_txt))
+
+            if args.url:
+                console.print(f"[cyan]🌐 Scraping main page: {args.url}[/cyan]")
+                page = await browser.new_page()
+                await page.goto(args.url, wait_until="domcontentloaded", timeout=args.max_wait * 1000)
+                page_links = await page.evaluate("function() {" + COLLECT_LINKS_JS + "}", ARTICLE_SELECTORS)
+                await page.close()
+                console.print(f"[green]📄 Found {len(page_links)} links (raw).[/green]")
+                links.extend(page_links)
+
+            links = prepare_links(links, args.filter_downloads)
+            if not links:
+                console.print("[red]❌ No links found![/red]")
+                return
+
+            console.print(f"\n[green]📋 Found {len(links)} candidate links[/green]")
+            console.print(f"[cyan]📁 Download directory: {download_dir}[/cyan]")
+            name_map = resolve_filenames(links)
+            pending = pending_links(download_dir, links, name_map)
+
+            successful = 0
+            failed = 0
+            skipped = len(links) - len(pending)
+
+            if not pending:
+                console.print("[green]✅ Everything is already downloaded[/green]")
+                print_summary(len(links), successful, skipped, failed, download_dir)
+                return
+
+            console.print(f"[cyan]🧵 Workers: {workers} (async)[/cyan]")
+            sem = asyncio.Semaphore(workers)
+            # names picked for in-flight saves, so two links can't claim the same free name
+            reserved_names: set = set()
+
+            with make_progress() as progress:
+                main_task = progress.add_task("[cyan]Overall Progress", total=len(links), completed=skipped,
+                                              success=0, skipped=skipped, failed=0)
+
+                async def handle(idx: int, link: str) -> None:
+                    nonlocal successful, failed
+                    async with sem:
+                        filename = name_map[link] or link[:60]
+                        console.print(f"[bold cyan][{idx}/{len(pending)}][/bold cyan] {filename}")
+                        ok = False
+                        ctx = None
+                        try:
+                            ctx = await browser.new_context(accept_downloads=True)
+                            page = await ctx.new_page()
+                            await page.goto(link, wait_until="domcontentloaded", timeout=args.max_wait * 1000)
+                            try:
+                                await page.evaluate(REMOVE_OVERLAYS_JS)
+                            except Exception:
+                                pass
+
+                            btn = await find_download_button_async(page, args.max_wait)
+                            if btn is None:
+                                console.print("  [red]❌ Could not find download button[/red]")
+                            else:
+                                async with page.expect_download(timeout=150 * 1000) as dl_info:
+                                    await btn.click()
+                                dl = await dl_info.value
+                                target = free_download_path(download_dir, dl.suggested_filename, reserved_names)
+                                await dl.save_as(target)
+                                console.print(f"  [green]✅ Downloaded: {target.name}[/green]")
+                                ok = True
+                        except Exception as e:
+                            console.print(f"  [red]❌ Error: {e}[/red]")
+                        finally:
+                            if ctx is not None:
+                                await ctx.close()
+
+                        if ok:
+                            successful += 1
+                        else:
+                            failed += 1
+                        progress.update(main_task, advance=1, success=successful, skipped=skipped, failed=failed)
+                        await asyncio.sleep(args.delay_between)
+
+                await asyncio.gather(*[handle(idx, link) for idx, link in enumerate(pending, 1)])
+
+            print_summary(len(links), successful, skipped, failed, download_dir)
+        finally:
+            await browser.close()
+            console.print("[dim]🔒 Browser closed[/dim]")
 
 
 if __name__ == "__main__":
@@ -707,14 +1358,24 @@ if __name__ == "__main__":
     parser.add_argument("--headless", action="store_true", default=False, help="Run browser in headless mode")
     parser.add_argument("--no-image-block", action="store_true", default=False, help="Don't block images (set when site needs images/js to render)")
     parser.add_argument("--max-wait", type=int, default=DEFAULT_MAX_WAIT, help="Max wait time for elements (seconds)")
-    parser.add_argument("--session-refresh", type=int, default=DEFAULT_SESSION_REFRESH, help="Restart browser after this many successful downloads")
+    parser.add_argument("--session-refresh", type=int, default=DEFAULT_SESSION_REFRESH, help="Reset browser cookies/storage (the cache is kept) after this many successful downloads")
     parser.add_argument("--delay-between", type=float, default=2.0, help="Delay between processing links (seconds)")
     parser.add_argument("--filter-downloads", action="store_true", help="Try to filter scraped links to likely download pages")
     parser.add_argument("--input-txt",type=str,help="Path to a .txt file containing URLs to download (one per line).")
+    parser.add_argument("--profile-dir", type=str, default=str(DEFAULT_PROFILE_DIR), help="Persistent Chrome profile directory (HTTP cache reused across runs)")
+    parser.add_argument("--fresh-profile", action="store_true", default=False, help="Use a throwaway Chrome profile instead of --profile-dir")
+    parser.add_argument("--async", dest="use_async", action="store_true", default=False, help="Use Playwright's async API (one browser, one context per download) instead of Selenium; --profile-dir/--fresh-profile and --session-refresh are ignored")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Number of parallel browser workers (capped at {MAX_WORKERS})")
 
     args = parser.parse_args()
     # map to expected names
     args.session_refresh = args.session_refresh
     args.no_image_block = args.no_image_block
 
-    run(args)
+    if args.use_async:
+        try:
+            asyncio.run(run_async(args))
+        except KeyboardInterrupt:
+            console.print("\n[yellow]⚠️ Script interrupted by user[/yellow]")
+    else:
+        run(args)